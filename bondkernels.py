@@ -0,0 +1,149 @@
+"""Bond pricing kernels shared by the analysis scripts
+
+Kept free of script code so the scripts can import it without running each
+other's analysis. Numba and numexpr are used when installed.
+"""
+import functools
+import numpy as np
+
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:  # Numba is optional; the NumPy pricing path is used without it
+    _HAVE_NUMBA = False
+
+try:
+    import numexpr as ne
+    _HAVE_NUMEXPR = True
+except ImportError:  # numexpr is optional; plain NumPy is used for grid pricing without it
+    _HAVE_NUMEXPR = False
+
+@functools.lru_cache(maxsize=64)
+def time_grid(T, freq):
+    """Coupon payment times (years) for a bond, cached per (T, freq)
+    T: Time to Maturity (years)
+    freq: Payment frequency per year
+    """
+    t = np.arange(1, int(T*freq)+1, dtype=np.float64)/freq
+    t.flags.writeable = False  # Shared between callers through the cache
+    return t
+
+if _HAVE_NUMBA:
+    # Fast-math without the no-NaN/no-inf assumptions, so missing (NaN) yields
+    # price to NaN as they do in NumPy instead of tripping a division check
+    _FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+    @njit(cache=True, fastmath=_FASTMATH, error_model='numpy')
+    def _price_nb(fv, T, ytm, coupon, freq, n):
+        """Compiled bond price: n coupon payments plus face value repaid at T"""
+        base = 1.0 + ytm/freq
+        acc = 0.0
+        for i in range(n):
+            acc += coupon/base**(i+1)
+        return acc + fv/base**(freq*T)
+
+    @njit(cache=True, fastmath=_FASTMATH, error_model='numpy', parallel=True)
+    def _price_grid_nb(fv, T, ytms, coupon, freq, n):
+        """Compiled bond prices for a flat array of yields, split across cores"""
+        out = np.empty_like(ytms)
+        for k in prange(ytms.size):
+            out[k] = _price_nb(fv, T, ytms[k], coupon, freq, n)
+        return out
+
+def array_newton(f_and_fp, x0, tol=1e-8, maxiter=50, full_output=False):
+    """Solve many independent root problems at once with Newton's method
+    f_and_fp: Function returning (f(x), f'(x)) evaluated elementwise on an array x
+    x0: Initial guess (scalar or array)
+    tol: Convergence tolerance on the Newton step, relative to 1 + |x|; unlike a
+         test on |f(x)| this does not depend on the scale of f (e.g. bond notional)
+    maxiter: Maximum number of Newton iterations
+    full_output: If True, return (x, converged) rather than raising when some
+                 elements take a non-finite step or run out of iterations
+
+    Yield of a 30-year 5% semi-annual bond with 1e8 notional priced at 95e6:
+    >>> t = time_grid(30.0, 2.0)
+    >>> def f(y):
+    ...     p, dp = price_and_dprice(y, 2.5e6, 1e8, 2.0, t, 30.0)
+    ...     return p - 95e6, dp
+    >>> round(float(array_newton(f, 0.05)), 5)
+    0.05336
+    """
+    x = np.array(x0, dtype=np.float64)
+    converged = np.zeros(x.shape, dtype=bool)
+    failed = np.zeros(x.shape, dtype=bool)  # Hit a non-finite step; x is left where it stopped
+    for _ in range(maxiter):
+        fx, dfx = f_and_fp(x)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step = np.where(converged | failed | (fx == 0), 0.0, fx/dfx)
+        stalled = ~np.isfinite(step)
+        if stalled.any():
+            if not full_output:
+                raise RuntimeError("array_newton took a non-finite Newton step (zero derivative or NaN residual)")
+            failed |= stalled
+            step[stalled] = 0.0
+        x -= step
+        # Mixed step test: about tol absolute for |x| << 1 and tol relative for |x| >> 1
+        # (scipy.optimize.newton uses a purely absolute step test)
+        converged |= ~failed & (np.abs(step) < tol*(1 + np.abs(x)))
+        if (converged | failed).all():
+            break
+    if full_output:
+        return x, converged
+    if not converged.all():
+        raise RuntimeError(f"array_newton failed to converge after {maxiter} iterations")
+    return x
+
+def price_and_dprice(y, coupon, fv, freq, t, T):
+    """Bond price and its analytic derivative with respect to yield
+    y: Yield (decimal), scalar or array
+    coupon: Coupon payment per period, or array of per-period cash flows
+            with coupon dates on the last axis
+    fv: Face Value
+    freq: Payment frequency per year
+    t: Coupon payment times (years)
+    T: Time at which face value is repaid (years)
+    """
+    base = np.asarray(1+y/freq)
+    disc = base[..., None]**(-freq*t)
+    fv_disc = base**(-freq*T)
+    price = np.sum(coupon*disc, axis=-1) + fv*fv_disc
+    dprice = -(np.sum(coupon*t*disc, axis=-1) + fv*T*fv_disc)/base
+    return price, dprice
+
+@functools.lru_cache(maxsize=64)
+def make_pricer(fv, T, coup, freq=2, dtype=np.float64):
+    """Build a pricing function specialised to one bond, cached per bond
+    fv: Face Value
+    T: Time to Maturity (years)
+    coup: Annual coupon rate (%)
+    freq: Payment frequency per year (2 = semi-annual)
+    dtype: Floating-point type used for array pricing on the NumPy/numexpr paths;
+           the compiled kernels always work in float64, so it has no effect with Numba
+    Returns price(y), where y is a scalar or array of total yields (decimal)
+    """
+    freq = float(freq)
+    periods = int(T*freq)
+    coupon = coup/100*fv/freq
+    exponents = (-freq*time_grid(T, freq)).astype(dtype)  # Fixed for this bond
+    fv_exponent = -freq*T
+    
+    def price(y):
+        if _HAVE_NUMBA:
+            y = np.asarray(y, dtype=np.float64)  # Narrower inputs would only be rounded, not priced faster
+            if y.ndim == 0:
+                return _price_nb(fv, T, float(y), coupon, freq, periods)
+            return _price_grid_nb(fv, T, y.ravel(), coupon, freq, periods).reshape(y.shape)
+        y = np.asarray(y, dtype=dtype)
+        base = 1+y/freq
+        if _HAVE_NUMEXPR and y.ndim > 0:
+            # Fused power and sum over coupon dates; the discount tensor is never materialised
+            total = ne.evaluate(f"sum(base ** exponents, axis={y.ndim})",
+                                local_dict={"base": base[..., None], "exponents": exponents})
+        else:
+            # Build the discount tensor once and reduce it in place to avoid extra temporaries
+            disc = np.power(base[..., None], exponents)  # Discount factors, coupon dates on the last axis
+            total = disc.sum(axis=-1)
+        total *= coupon
+        total += fv*base**fv_exponent
+        return total
+    return price
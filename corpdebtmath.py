@@ -2,6 +2,7 @@ import scipy.optimize as optimize
 import matplotlib.pyplot as plt
 import numpy as np
 from scipy.stats import norm
+from bondkernels import array_newton, make_pricer, price_and_dprice, time_grid
 
 ###########################################
 # Corporate Bond Math Functions
@@ -16,18 +17,25 @@ def corp_ytm(price, fv, T, coup, credit_spread, freq=2, guess=0.05):
     credit_spread: Credit spread over risk-free rate (bps)
     freq: Payment frequency per year (2 = semi-annual)
     guess: Initial YTM guess
+    price, fv, T, coup and credit_spread may be arrays; they are broadcast
+    against each other and one YTM is solved per bond in the same iterations
     """
     freq = float(freq)
-    periods = T*freq
+    price, fv, T, coup, credit_spread = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (price, fv, T, coup, credit_spread)))
+    periods = (T*freq).astype(int)
     coupon = coup/100*fv/freq
     spread_decimal = credit_spread/10000  # Convert bps to decimal
     
-    dt = [(i+1)/freq for i in range(int(periods))]
-    ytm_func = lambda y: sum([coupon/(1+(y+spread_decimal)/freq)**(freq*t) for t in dt]) + \
-                        fv/(1+(y+spread_decimal)/freq)**(freq*T) - price
-    return optimize.newton(ytm_func, guess)
-
-def corp_price(fv, T, rf_rate, credit_spread, coup, freq=2):
+    t = time_grid(float(T.max()), freq)  # Payment times of the longest bond
+    # Shorter bonds get zero cash flow after their last coupon date
+    cash_flows = np.where(t <= (periods/freq)[..., None], coupon[..., None], 0.0)
+    def ytm_func(y):
+        p, dp = price_and_dprice(y+spread_decimal, cash_flows, fv, freq, t, T)
+        return p - price, dp
+    return array_newton(ytm_func, np.full(price.shape, guess))[()]
+
+def corp_price(fv, T, rf_rate, credit_spread, coup, freq=2, dtype=np.float64):
     """Calculate corporate bond price given risk-free rate and credit spread
     fv: Face Value
     T: Time to maturity (years)
@@ -35,17 +43,14 @@ def corp_price(fv, T, rf_rate, credit_spread, coup, freq=2):
     credit_spread: Credit spread in basis points
     coup: Annual coupon rate (%)
     freq: Payment frequency per year
+    dtype: Floating-point type used to price arrays without Numba (float32 is plenty
+           for plotting and halves the NumPy discount tensor)
+    rf_rate and credit_spread may be arrays; they are broadcast against
+    each other and an array of prices is returned
     """
-    freq = float(freq)
-    periods = T*freq
-    coupon = coup/100*fv/freq
-    spread_decimal = credit_spread/10000
-    
+    spread_decimal = np.asarray(credit_spread)/10000
     total_rate = rf_rate + spread_decimal
-    dt = [(i+1)/freq for i in range(int(periods))]
-    price = sum([coupon/(1+total_rate/freq)**(freq*t) for t in dt]) + \
-            fv/(1+total_rate/freq)**(freq*T)
-    return price
+    return make_pricer(float(fv), float(T), float(coup), float(freq), dtype)(total_rate)
 
 def credit_duration(price, par, T, coup, spread, freq=2, dy=0.0001):
     """Calculate credit spread duration
@@ -63,12 +68,10 @@ def credit_duration(price, par, T, coup, spread, freq=2, dy=0.0001):
 def default_probability(credit_spread, recovery_rate=0.4):
     """Estimate annual default probability from credit spread
     Using simplified calculation: spread = PD * (1-RR)
-    credit_spread: in basis points
+    credit_spread: in basis points, scalar or array of spreads
     recovery_rate: expected recovery in default (decimal)
     """
-    spread_decimal = credit_spread/10000
-    pd = spread_decimal/(1-recovery_rate)
-    return pd
+    return np.asarray(credit_spread)/10000/(1-recovery_rate)
 
 def oas_price(fv, T, rf_rate, credit_spread, coup, volatility, freq=2, steps=50):
     """Calculate option-adjusted spread price
@@ -79,40 +82,66 @@ def oas_price(fv, T, rf_rate, credit_spread, coup, volatility, freq=2, steps=50)
     d = 1/u
     p = (1 - d)/(u - d)
     
-    rates = np.zeros(steps + 1)
-    rates[0] = rf_rate
-    
-    for i in range(1, steps + 1):
-        rates[i] = rates[i-1] * u
+    rates = rf_rate * u**np.arange(steps + 1)
+    # Per-node discount factor over one step, shared by every level of the tree
+    discount = np.exp(-(rates + credit_spread/10000) * dt)
     
     prices = np.zeros(steps + 1)
     prices[:] = fv
     
+    # Backward induction, one vector update per level
     for i in range(steps-1, -1, -1):
-        for j in range(i+1):
-            r = rates[j]
-            prices[j] = (p * prices[j+1] + (1-p) * prices[j]) * np.exp(-(r + credit_spread/10000) * dt)
-            if i % (freq * T/steps) == 0:  # Add coupon payments
-                prices[j] += coup/100 * fv/freq
+        prices[:i+1] = (p * prices[1:i+2] + (1-p) * prices[:i+1]) * discount[:i+1]
+        if i % (freq * T/steps) == 0:  # Add coupon payments
+            prices[:i+1] += coup/100 * fv/freq
     
     return prices[0]
 
-def z_spread(price, treasury_curve, cash_flows, payment_times):
-    """Calculate Z-spread over treasury curve"""
+def z_spread(price, curve_times, curve_rates, cash_flows, payment_times):
+    """Calculate Z-spread over treasury curve
+    curve_times: Treasury curve tenors (years), increasing
+    curve_rates: Treasury yields at those tenors (decimal)
+    price may be an array of prices for the same cash flows; one spread
+    (bps) is returned per price, all solved in the same Newton iterations.
+    Spreads may be negative; NaN is returned for a price with no spread in
+    [-10000, 10000] bps
+    """
+    # Curve rates at every payment date don't depend on the spread, so interpolate once
+    payment_times = np.asarray(payment_times, dtype=np.float64)
+    rates = np.interp(payment_times, curve_times, curve_rates)
+    cash_flows = np.asarray(cash_flows, dtype=np.float64)
+    exponents = -2*payment_times  # Semi-annual compounding
+    
+    price = np.asarray(price, dtype=np.float64)
+    
     def npv(spread):
-        total = 0
-        for cf, t in zip(cash_flows, payment_times):
-            r = np.interp(t, [x[0] for x in treasury_curve], [x[1] for x in treasury_curve])
-            # Ensure positive discount rate and proper scaling
-            discount_rate = max(0.0001, r + spread/10000)  # Convert bps to decimal
-            total += cf / ((1 + discount_rate/2)**(2*t))  # Semi-annual compounding
-        return total - price
+        """Present value of the cash flows and its derivative with respect to spread"""
+        # Ensure positive discount rate and proper scaling
+        discount_rates = np.maximum(0.0001, rates + np.asarray(spread)[..., None]/10000)  # Convert bps to decimal
+        disc = (1 + discount_rates/2)**exponents
+        # dPV/dspread, zero wherever the discount rate floor is active
+        slope = -((discount_rates > 0.0001) * disc/(1 + discount_rates/2)) @ (cash_flows*payment_times) / 10000
+        return disc @ cash_flows, slope
+    
+    def residual(spread):
+        pv, slope = npv(spread)
+        return pv - price, slope
     
-    try:
-        return optimize.brentq(npv, 0, 500, maxiter=100)  # Increased max iterations
-    except ValueError as e:
-        print(f"Z-spread calculation failed: {e}")
-        return None
+    max_spread = 10000  # bps; spreads are only reported within +/- this bound
+    spreads, converged = array_newton(residual, np.full(price.shape, 100.0), full_output=True)
+    converged &= np.abs(spreads) <= max_spread
+    spreads, prices = spreads.ravel(), price.ravel()
+    
+    # Newton can stall (e.g. flat region under the rate floor) or land outside the
+    # bound; only those prices fall back to the bracketed solver over the bound, so
+    # negative spreads are found too. A price with no root in that bracket gets NaN.
+    for i in np.flatnonzero(~converged):
+        try:
+            spreads[i] = optimize.brentq(lambda s: npv(s)[0] - prices[i], -max_spread, max_spread, maxiter=100)
+        except (ValueError, RuntimeError) as e:
+            print(f"Z-spread calculation failed for price {prices[i]}: {e}")
+            spreads[i] = np.nan
+    return spreads.reshape(price.shape)[()]
 
 ###########################################
 # Peer Comparison Data
@@ -124,18 +153,18 @@ peer_data = {
     'Apple 2.55% 2060': {'spread': 80, 'rating': 'AA+'},
 }
 
+# Peer data as parallel columns, ready for batched calls such as default_probability(peer_spreads)
+peer_names = list(peer_data.keys())
+peer_spreads = np.array([data['spread'] for data in peer_data.values()])
+peer_ratings = np.array([data['rating'] for data in peer_data.values()])
+
 ###########################################
 # Treasury Curve Data
 ###########################################
 
-treasury_curve = [
-    (1, 0.0450),   # 1Y
-    (2, 0.0455),   # 2Y
-    (5, 0.0460),   # 5Y
-    (10, 0.0465),  # 10Y
-    (20, 0.0470),  # 20Y
-    (30, 0.0479),  # 30Y
-]
+# Tenors (years) and yields held as parallel arrays, ready for np.interp
+treasury_times = np.array([1, 2, 5, 10, 20, 30], dtype=np.float64)
+treasury_rates = np.array([0.0450, 0.0455, 0.0460, 0.0465, 0.0470, 0.0479])  # 1Y, 2Y, 5Y, 10Y, 20Y, 30Y
 
 ###########################################
 # Analysis of Alphabet 2.25% 2060 Bond
@@ -163,15 +192,13 @@ print(f"Annual Default Probability: {pd*100:.4f}%")
 print(f"Yield to Maturity: {(rf_rate + credit_spread/10000)*100:.2f}%")
 
 # Create spread sensitivity analysis
-spread_changes = np.arange(-500, 550, 50)  # -500 to +500 bps in 50bps steps
-pct_changes = []
+spread_step = 50
+spread_changes = np.arange(-500, 500 + spread_step, spread_step)  # -500 to +500 bps in 50bps steps
 
 base_price = corp_price(par, T, rf_rate, credit_spread, coup, freq)
-for ds in spread_changes:
-    new_spread = credit_spread + ds
-    new_price = corp_price(par, T, rf_rate, new_spread, coup, freq)
-    pct_change = ((new_price / base_price) - 1) * 100
-    pct_changes.append(pct_change)
+# Plotted sweeps are priced in float32 on the NumPy path; YTM and headline figures stay in float64
+new_prices = corp_price(par, T, rf_rate, credit_spread + spread_changes, coup, freq, dtype=np.float32)
+pct_changes = ((new_prices / base_price) - 1) * 100
 
 # Additional Analysis
 volatility = 0.15  # Interest rate volatility
@@ -181,7 +208,7 @@ oas_price = oas_price(par, T, rf_rate, credit_spread, coup, volatility)
 payment_times = np.arange(0.5, T+0.5, 0.5)
 cash_flows = [coup/100 * par/2] * len(payment_times)
 cash_flows[-1] += par
-z_spd = z_spread(price, treasury_curve, cash_flows, payment_times)
+z_spd = z_spread(price, treasury_times, treasury_rates, cash_flows, payment_times)
 
 print("\nAdvanced Metrics")
 print("---------------")
@@ -190,8 +217,8 @@ print(f"Z-spread: {z_spd:.0f} bps")
 
 print("\nPeer Comparison")
 print("--------------")
-for name, data in peer_data.items():
-    print(f"{name}: {data['spread']} bps ({data['rating']})")
+for name, spread, rating in zip(peer_names, peer_spreads, peer_ratings):
+    print(f"{name}: {spread} bps ({rating})")
 
 ###########################################
 # Visualizations
@@ -207,7 +234,7 @@ plt.axvline(x=0, color='black', linestyle='-', linewidth=0.5)
 
 # Add markers for key spread changes
 for ds in [-500, -250, 250, 500]:  # Adjusted marker points
-    idx = np.where(spread_changes == ds)[0][0]
+    idx = (ds - spread_changes[0]) // spread_step  # Position on the uniform grid
     pct = pct_changes[idx]
     plt.plot([ds, ds], [0, pct], 'k:', alpha=0.5)
     plt.text(ds + 5, pct, f'{pct:.1f}%',
@@ -227,15 +254,12 @@ plt.savefig('alphabet_spread_sensitivity.png',
 plt.close()
 
 # 2. Interest Rate Sensitivity
-rate_changes = np.arange(-4, 4.5, 0.5)  # Match treasury range of ±4%
-rate_price_changes = []
+rate_step = 0.5
+rate_changes = np.arange(-4, 4 + rate_step, rate_step)  # Match treasury range of ±4%
 
 base_price = corp_price(par, T, rf_rate, credit_spread, coup, freq)
-for dr in rate_changes:
-    new_rate = rf_rate + dr/100
-    new_price = corp_price(par, T, new_rate, credit_spread, coup, freq)
-    pct_change = ((new_price / base_price) - 1) * 100
-    rate_price_changes.append(pct_change)
+new_prices = corp_price(par, T, rf_rate + rate_changes/100, credit_spread, coup, freq, dtype=np.float32)
+rate_price_changes = ((new_prices / base_price) - 1) * 100
 
 plt.figure(figsize=(12, 8))
 plt.style.use('classic')
@@ -250,7 +274,7 @@ plt.axvline(x=0, color='black', linestyle='-', linewidth=0.5)
 # Add markers and labels for 1% changes
 for dr in range(-3, 4):
     if dr != 0:
-        idx = np.where(rate_changes == dr)[0][0]
+        idx = int(round((dr - rate_changes[0]) / rate_step))  # Position on the uniform grid
         pct = rate_price_changes[idx]
         # Vertical reference line
         plt.plot([dr, dr], [0, pct], 'k:', alpha=0.5)
@@ -277,9 +301,9 @@ plt.close()
 # 3. Peer Comparison
 plt.figure(figsize=(12, 6))
 
-peers = list(peer_data.keys()) + ['Alphabet 2.25% 2060']
-spreads = [data['spread'] for data in peer_data.values()] + [credit_spread]
-ratings = [data['rating'] for data in peer_data.values()] + ['AA2/AA+']
+peers = peer_names + ['Alphabet 2.25% 2060']
+spreads = np.append(peer_spreads, credit_spread)
+ratings = np.append(peer_ratings, 'AA2/AA+')
 
 # Create horizontal bar chart
 y_pos = np.arange(len(peers))
@@ -308,15 +332,10 @@ plt.style.use('classic')
 rate_changes = np.arange(-2, 2.5, 0.5)  # Smaller range for readability
 spread_changes = np.array([-500, -250, 0, 250, 500])  # Key spread changes in bps
 
-# Create matrix of price changes
-combined_changes = np.zeros((len(spread_changes), len(rate_changes)))
-for i, ds in enumerate(spread_changes):
-    for j, dr in enumerate(rate_changes):
-        new_rate = rf_rate + dr/100
-        new_spread = credit_spread + ds
-        new_price = corp_price(par, T, new_rate, new_spread, coup, freq)
-        pct_change = ((new_price / base_price) - 1) * 100
-        combined_changes[i, j] = pct_change
+# Create matrix of price changes (rows: spread scenarios, columns: rate scenarios)
+new_prices = corp_price(par, T, rf_rate + rate_changes/100,
+                        credit_spread + spread_changes[:, None], coup, freq, dtype=np.float32)
+combined_changes = ((new_prices / base_price) - 1) * 100
 
 # Plot multiple lines for different spread scenarios
 for i, ds in enumerate(spread_changes):
@@ -4,18 +4,58 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from datetime import datetime, timedelta
+import functools
+import os
 import requests
 from config import ALPHA_VANTAGE_API_KEY
+from bondkernels import make_pricer
 
 def get_historical_volatility(prices, window=30):
     """Calculate historical volatility from daily returns"""
-    returns = np.log(prices / prices.shift(1))
-    return returns.rolling(window=window).std() * np.sqrt(252)  # Annualized
+    arr = prices.to_numpy(dtype=np.float64)
+    # Log returns computed in place on one buffer; the first day has no return
+    returns = np.full(arr.shape, np.nan)
+    np.divide(arr[1:], arr[:-1], out=returns[1:])
+    np.log(returns[1:], out=returns[1:])
+    vol = pd.Series(returns, index=prices.index).rolling(window=window).std()
+    vol *= np.sqrt(252)  # Annualized
+    return vol
+
+# On-disk cache for downloaded market data, refreshed once it is older than CACHE_MAX_AGE
+CACHE_DIR = '.cache'
+CACHE_MAX_AGE = timedelta(days=1)
+
+def _read_cache(key):
+    """Return the cached DataFrame for key, or None if missing or stale"""
+    path = os.path.join(CACHE_DIR, f'{key}.parquet')
+    if not os.path.exists(path):
+        return None
+    if datetime.now() - datetime.fromtimestamp(os.path.getmtime(path)) > CACHE_MAX_AGE:
+        return None
+    try:
+        df = pd.read_parquet(path)
+    except Exception as e:  # e.g. pyarrow missing or a corrupt file; treated as a miss
+        print(f"Warning: could not read cached data from {path}: {e}")
+        return None
+    print(f"Using cached data from {path}")
+    return df
+
+def _write_cache(key, df):
+    """Store df in the on-disk cache under key; a failed write only warns"""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        df.to_parquet(os.path.join(CACHE_DIR, f'{key}.parquet'))
+    except Exception as e:  # e.g. CACHE_DIR is a file or pyarrow is missing
+        print(f"Warning: could not cache {key}: {e}")
 
 def get_tlt_data():
     """Get TLT price data from Jan 2024 to Jan 2025"""
     start_date = pd.Timestamp('2024-01-01')
     end_date = pd.Timestamp('2025-01-31')
+    cache_key = f"TLT_av-daily_{start_date:%Y%m%d}_{end_date:%Y%m%d}"
+    hist = _read_cache(cache_key)
+    if hist is not None:
+        return hist
     
     try:
         hist = web.DataReader('TLT', 'av-daily',
@@ -24,41 +64,50 @@ def get_tlt_data():
         print("Successfully retrieved TLT data")
         hist.index = pd.to_datetime(hist.index)
         print("Date range:", hist.index[0], "to", hist.index[-1])
-        return hist
     except Exception as e:
         print(f"Error getting TLT data: {e}")
         return None
+    
+    _write_cache(cache_key, hist)
+    return hist
 
 def price_bond(fv, T, ytm, coup, freq=2):
-    """Calculate bond price"""
-    freq = float(freq)
-    periods = T*freq
-    coupon = coup/100*fv/freq
+    """Calculate bond price
+    ytm may be an array of yields, in which case an array of prices is returned
+    """
+    return make_pricer(float(fv), float(T), float(coup), float(freq))(ytm)
+
+@functools.lru_cache(maxsize=None)
+def _load_treasury_yields():
+    """Load historical 30Y Treasury yields from the disk cache or Alpha Vantage
+    A failed download raises, so lru_cache only keeps successful loads
+    """
+    cache_key = "TREASURY_YIELD_daily_30year"
+    yields_df = _read_cache(cache_key)
+    if yields_df is not None:
+        return yields_df
+    
+    url = f'https://www.alphavantage.co/query?function=TREASURY_YIELD&interval=daily&maturity=30year&apikey={ALPHA_VANTAGE_API_KEY}'
+    r = requests.get(url)
+    data = r.json()
+    
+    # Convert to DataFrame
+    yields_df = pd.DataFrame(data['data'])
+    yields_df['date'] = pd.to_datetime(yields_df['date'])
+    # Clean the yield values
+    yields_df['value'] = pd.to_numeric(yields_df['value'], errors='coerce') / 100
+    yields_df = yields_df.dropna()  # Remove any invalid values
+    yields_df.set_index('date', inplace=True)
     
-    dt = [(i+1)/freq for i in range(int(periods))]
-    price = sum([coupon/(1+ytm/freq)**(freq*t) for t in dt]) + \
-            fv/(1+ytm/freq)**(freq*T)
-    return price
+    print("Treasury yields range:", yields_df.index[0], "to", yields_df.index[-1])
+    print("Yield range:", yields_df['value'].min(), "to", yields_df['value'].max())
+    _write_cache(cache_key, yields_df)
+    return yields_df
 
 def get_treasury_yields():
     """Get historical 30Y Treasury yields"""
     try:
-        url = f'https://www.alphavantage.co/query?function=TREASURY_YIELD&interval=daily&maturity=30year&apikey={ALPHA_VANTAGE_API_KEY}'
-        r = requests.get(url)
-        data = r.json()
-        
-        # Convert to DataFrame
-        yields_df = pd.DataFrame(data['data'])
-        yields_df['date'] = pd.to_datetime(yields_df['date'])
-        # Clean the yield values
-        yields_df['value'] = pd.to_numeric(yields_df['value'], errors='coerce') / 100
-        yields_df = yields_df.dropna()  # Remove any invalid values
-        yields_df.set_index('date', inplace=True)
-        
-        print("Treasury yields range:", yields_df.index[0], "to", yields_df.index[-1])
-        print("Yield range:", yields_df['value'].min(), "to", yields_df['value'].max())
-        return yields_df
-        
+        return _load_treasury_yields()
     except Exception as e:
         print(f"Error getting Treasury yields: {e}")
         return None
@@ -77,18 +126,15 @@ def get_treasury_prices(hist_dates):
     maturity = 26.5  # Years to maturity
     coupon = 1.25   # 1.25% coupon
     
-    prices = []
-    for date in pd.to_datetime(hist_dates):
-        try:
-            # Get yield for that date or nearest previous date
-            daily_yield = yields_df.loc[yields_df.index <= date, 'value'].iloc[0]
-            price = price_bond(par, maturity, daily_yield, coupon)
-            prices.append(price)
-        except (KeyError, IndexError) as e:
-            print(f"Error calculating price for {date}: {e}")
-            prices.append(None)
+    # Get yield for each date or nearest previous date in one as-of lookup
+    hist_dates = pd.to_datetime(hist_dates)
+    daily_yields = yields_df['value'].sort_index().reindex(hist_dates, method='ffill').to_numpy()
+    missing = np.isnan(daily_yields)
+    if missing.any():
+        print(f"No yield on or before {hist_dates[missing][0]}; "
+              f"{missing.sum()} date(s) left without a price")
     
-    return np.array(prices)
+    return price_bond(par, maturity, daily_yields, coupon)
 
 def main():
     # Get price data
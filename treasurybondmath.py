@@ -12,9 +12,9 @@ def zcb(fv,y,t):
 print(zcb(100,0.02,2))
 
 
-import scipy.optimize as optimize
 import matplotlib.pyplot as plt
 import numpy as np
+from bondkernels import array_newton, make_pricer, price_and_dprice, time_grid
 
 ###########################################
 # Bond Math Functions
@@ -28,48 +28,50 @@ def b_ytm(price, fv, T, coup, freq=2, guess=0.05):
     coup: Annual coupon rate (%)
     freq: Payment frequency per year (2 = semi-annual)
     guess: Initial YTM guess
+    price, fv, T and coup may be arrays; they are broadcast against each
+    other and one YTM is solved per bond, all in the same Newton iterations
     """
     freq = float(freq)
-    periods = T*freq
+    price, fv, T, coup = np.broadcast_arrays(*(np.asarray(x, dtype=np.float64) for x in (price, fv, T, coup)))
+    periods = (T*freq).astype(int)
     coupon = coup/100*fv/freq  # Semi-annual coupon payment
-    dt = [(i+1)/freq for i in range(int(periods))]
-    ytm_func = lambda y: sum([coupon/(1+y/freq)**(freq*t) for t in dt]) + fv/(1+y/freq)**(freq*max(dt)) - price
-    return optimize.newton(ytm_func, guess)
+    t = time_grid(float(T.max()), freq)  # Payment times of the longest bond
+    t_fv = periods/freq  # Face value is repaid on the last coupon date
+    # Shorter bonds get zero cash flow after their last coupon date
+    cash_flows = np.where(t <= t_fv[..., None], coupon[..., None], 0.0)
+    def ytm_func(y):
+        p, dp = price_and_dprice(y, cash_flows, fv, freq, t, t_fv)
+        return p - price, dp
+    return array_newton(ytm_func, np.full(price.shape, guess))[()]
 
 def b_price(fv, T, ytm, coup, freq=2):
     """Calculate bond price given YTM
     fv: Face Value
     T: Time to Maturity (years)
-    ytm: Yield to Maturity (as decimal)
+    ytm: Yield to Maturity (as decimal), scalar or array of yields
     coup: Annual coupon rate (%)
     freq: Payment frequency per year (2 = semi-annual)
     """
-    freq = float(freq)
-    periods = T*freq
-    coupon = coup/100*fv/freq
-    dt = [(i+1)/freq for i in range(int(periods))]
-    price = sum([coupon/(1+ytm/freq)**(freq*t) for t in dt]) + fv/(1+ytm/freq)**(freq*T)
-    return price
+    return make_pricer(float(fv), float(T), float(coup), float(freq))(ytm)
 
-def mod_duration(price, par, T, coup, freq, dy=0.01):
-    """Calculate Modified Duration using central difference approximation"""
+def bond_risk(price, par, T, coup, freq, dy=0.01):
+    """Calculate YTM, Modified Duration and Convexity together
+    Uses one YTM solve and one central difference around it
+    Returns (ytm, mduration, convexity)
+    """
     ytm = b_ytm(price, par, T, coup, freq)
-    ytm_minus = ytm - dy
-    price_minus = b_price(par, T, ytm_minus, coup, freq)
-    ytm_plus = ytm + dy
-    price_plus = b_price(par, T, ytm_plus, coup, freq)
+    price_minus, price_plus = b_price(par, T, np.array([ytm - dy, ytm + dy]), coup, freq)
     mduration = (price_minus-price_plus)/(2*price*dy)
-    return mduration
+    convexity = (price_minus+price_plus-2*price)/(price*dy**2)
+    return ytm, mduration, convexity
+
+def mod_duration(price, par, T, coup, freq, dy=0.01):
+    """Calculate Modified Duration using central difference approximation"""
+    return bond_risk(price, par, T, coup, freq, dy)[1]
 
 def b_convexity(price, par, T, coup, freq, dy=0.01):
     """Calculate bond convexity using central difference approximation"""
-    ytm = b_ytm(price, par, T, coup, freq)
-    ytm_minus = ytm - dy
-    price_minus = b_price(par, T, ytm_minus, coup, freq)
-    ytm_plus = ytm + dy
-    price_plus = b_price(par, T, ytm_plus, coup, freq)
-    convexity = (price_minus+price_plus-2*price)/(price*dy**2)
-    return convexity
+    return bond_risk(price, par, T, coup, freq, dy)[2]
 
 ###########################################
 # Analysis of 2050 Treasury
@@ -83,9 +85,7 @@ freq = 2  # Semi-annual payments
 current_price = 50.0360
 
 # Calculate key metrics
-current_ytm = b_ytm(current_price, par, T, coup, freq)
-mdur = mod_duration(current_price, par, T, coup, freq)
-conv = b_convexity(current_price, par, T, coup, freq)
+current_ytm, mdur, conv = bond_risk(current_price, par, T, coup, freq)
 
 print(f"Current YTM: {current_ytm*100:.4f}%")
 print(f"Modified Duration: {mdur:.4f}")
@@ -98,24 +98,24 @@ print(f"Convexity: {conv:.4f}\n")
 print("Rate Change | Linear Approx | With Convexity | Actual Price | % Change")
 print("-" * 75)
 
-# Show detailed price changes for 1% increments
-for dr in range(-4, 5):
-    if dr != 0:  # Skip 0% change
-        dr_decimal = dr/100
-        
-        # Linear approximation (duration only)
-        linear_change = -mdur * dr * current_price
-        
-        # With convexity adjustment
-        convexity_adjustment = 0.5 * conv * (dr_decimal)**2 * current_price
-        total_change = linear_change + convexity_adjustment
-        
-        # Actual price using full calculation
-        new_ytm = current_ytm + dr_decimal
-        actual_price = b_price(par, T, new_ytm, coup, freq)
-        pct_change = ((actual_price / current_price) - 1) * 100
-        
-        print(f"{dr:+4d}%      | ${linear_change:8.2f}  | ${total_change:8.2f}  | ${actual_price:8.2f} | {pct_change:+7.2f}%")
+# Show detailed price changes for 1% increments (0% change skipped)
+deltas = np.array([-4, -3, -2, -1, 1, 2, 3, 4])
+deltas_decimal = deltas/100
+
+# Linear approximation (duration only)
+linear_changes = -mdur * deltas * current_price
+
+# With convexity adjustment
+convexity_adjustments = 0.5 * conv * (deltas_decimal)**2 * current_price
+total_changes = linear_changes + convexity_adjustments
+
+# Actual prices using full calculation, all scenarios in one call
+actual_prices = b_price(par, T, current_ytm + deltas_decimal, coup, freq)
+table_pct_changes = ((actual_prices / current_price) - 1) * 100
+
+for dr, linear_change, total_change, actual_price, pct_change in zip(
+        deltas, linear_changes, total_changes, actual_prices, table_pct_changes):
+    print(f"{dr:+4d}%      | ${linear_change:8.2f}  | ${total_change:8.2f}  | ${actual_price:8.2f} | {pct_change:+7.2f}%")
 
 print("\n")
 
@@ -124,13 +124,11 @@ print("\n")
 ###########################################
 
 # Calculate price changes for different yield scenarios
-rate_changes = np.arange(-4, 4.5, 0.5)  # Range of yield changes to analyze
-pct_changes = []
-for dr in rate_changes:
-    new_ytm = current_ytm + dr/100
-    actual_price = b_price(par, T, new_ytm, coup, freq)
-    pct_change = ((actual_price / current_price) - 1) * 100
-    pct_changes.append(pct_change)
+rate_step = 0.5
+rate_changes = np.arange(-4, 4 + rate_step, rate_step)  # Range of yield changes to analyze
+# Price every scenario in one call
+actual_prices = b_price(par, T, current_ytm + rate_changes/100, coup, freq)
+pct_changes = ((actual_prices / current_price) - 1) * 100
 
 ###########################################
 # Visualization
@@ -150,7 +148,7 @@ plt.axvline(x=0, color='black', linestyle='-', linewidth=0.5)
 # Add markers and labels for 1% yield changes
 for dr in range(-3, 4):  # Changed from range(-4, 5) to range(-3, 4)
     if dr != 0:
-        idx = np.where(rate_changes == dr)[0][0]
+        idx = int(round((dr - rate_changes[0]) / rate_step))  # Position on the uniform grid
         pct = pct_changes[idx]
         # Vertical reference line
         plt.plot([dr, dr], [0, pct], 'k:', alpha=0.5)
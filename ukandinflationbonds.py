@@ -1,7 +1,17 @@
+import math
+from concurrent.futures import ProcessPoolExecutor
 import scipy.optimize as optimize
+import matplotlib
+matplotlib.use('Agg')  # Charts are only written to PNG, so no GUI backend is needed
 import matplotlib.pyplot as plt
 import numpy as np
 
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:  # Numba is optional; linker_price then runs the same math-module body interpreted
+    _HAVE_NUMBA = False
+
 ###########################################
 # UK and Inflation-Linked Bond Functions
 ###########################################
@@ -14,10 +24,12 @@ def real_yield_to_nominal(real_yield, inflation_rate):
 
 def breakeven_inflation(nominal_price, real_price, T, nominal_coupon, real_coupon):
     """Calculate breakeven inflation rate between nominal and real bonds"""
+    # nominal_price = real_price*(1 + inflation)**T has an exact root for positive prices
+    if nominal_price > 0 and real_price > 0:
+        return (nominal_price/real_price)**(1.0/T) - 1.0
+
     def objective(inflation):
-        nominal_cf = nominal_coupon/2  # Semi-annual
-        real_cf = real_coupon/2 * (1 + inflation)**T
-        return nominal_price - real_price * (1 + inflation)**T
+        return nominal_price - real_price * (1.0 + inflation)**T
 
     # Use wider search range and handle potential errors
     try:
@@ -25,22 +37,99 @@ def breakeven_inflation(nominal_price, real_price, T, nominal_coupon, real_coupo
     except ValueError:
         # If brentq fails, try a grid search
         test_rates = np.linspace(-0.10, 0.25, 1000)
-        values = [abs(objective(r)) for r in test_rates]
-        return test_rates[np.argmin(values)]
-
-def linker_price(fv, T, real_yield, inflation_rate, real_coup, freq=2):
-    """Calculate inflation-linked bond price"""
+        return test_rates[np.abs(nominal_price - real_price * (1 + test_rates)**T).argmin()]
+
+def linker_price_vec(fv, T, real_yield, inflation_rate, real_coup, freq=2):
+    """Calculate inflation-linked bond prices for arrays of scenarios
+    real_yield and inflation_rate may be arrays; they are broadcast against
+    each other and an array of prices is returned
+
+    Matches discounting every inflated cash flow, including the r = 1 case:
+    >>> def loop_price(T, ry, infl, fv=100.0, coup=0.5, freq=2.0):
+    ...     dt = np.arange(1, int(T*freq)+1)/freq
+    ...     coupons = sum(coup/100*fv/freq*(1+infl)**t/(1+ry/freq)**(freq*t) for t in dt)
+    ...     return coupons + fv*(1+infl)**T/(1+ry/freq)**(freq*T)
+    >>> grid = [(T, ry, infl) for T in (0.5, 5, 37, 49) for ry in (-0.01, 0.0, 0.0175, 0.0445)
+    ...         for infl in (-0.02, 0.0, 0.041, (1 + ry/2)**2 - 1)]
+    >>> bool(max(abs(linker_price_vec(100, T, ry, infl, 0.5)/loop_price(T, ry, infl) - 1) for T, ry, infl in grid) < 1e-10)
+    True
+    >>> bool(max(abs(linker_price(100, T, ry, infl, 0.5)/loop_price(T, ry, infl) - 1) for T, ry, infl in grid) < 1e-10)
+    True
+    """
     freq = float(freq)
-    periods = T*freq
+    periods = int(T*freq)
     real_coupon = real_coup/100*fv/freq
+    real_yield = np.asarray(real_yield, dtype=np.float64)
+    inflation_rate = np.asarray(inflation_rate, dtype=np.float64)
     
-    # Inflate face value and coupons
-    inflated_fv = fv * (1 + inflation_rate)**T
+    # The price depends on the scenario only through the per-period growth ratio
+    # r = (1+inflation)**(1/freq)/(1+real_yield/freq). The input held fixed in a
+    # sweep stays a scalar, so its log is taken once rather than per scenario
+    log_r = np.log1p(inflation_rate)/freq - np.log1p(real_yield/freq)
     
-    dt = [(i+1)/freq for i in range(int(periods))]
-    price = sum([real_coupon*(1 + inflation_rate)**t/(1+real_yield/freq)**(freq*t) for t in dt]) + \
-            inflated_fv/(1+real_yield/freq)**(freq*T)
-    return price
+    # Inflated, discounted coupons form a geometric series with ratio r per period:
+    # sum_{k=1..n} r**k = r*(r**n - 1)/(r - 1), evaluated via log(r) to stay accurate near r = 1
+    flat = np.abs(log_r) < 1e-15
+    log_r_safe = np.where(flat, 1.0, log_r)  # Keeps the unused branch free of 0/0
+    coupon_pv = np.where(flat, real_coupon*periods,
+                         real_coupon*np.exp(log_r)*np.expm1(periods*log_r_safe)/np.expm1(log_r_safe))
+    
+    # Inflated face value discounted to today: fv*(1+inflation)**T/(1+real_yield/freq)**(freq*T)
+    return coupon_pv + fv*np.exp(freq*T*log_r)
+
+def _linker_price_scalar(fv, T, real_yield, inflation_rate, real_coup, freq):
+    """Scalar closed-form linker price (see linker_price_vec) using math-module calls only"""
+    periods = int(T*freq)
+    real_coupon = real_coup/100*fv/freq
+    log_r = math.log1p(inflation_rate)/freq - math.log1p(real_yield/freq)
+    if abs(log_r) < 1e-15:
+        coupon_pv = real_coupon*periods
+    else:
+        coupon_pv = real_coupon*math.exp(log_r)*math.expm1(periods*log_r)/math.expm1(log_r)
+    return coupon_pv + fv*math.exp(freq*T*log_r)
+
+if _HAVE_NUMBA:
+    _linker_price_scalar = njit(cache=True, fastmath=True)(_linker_price_scalar)
+    _linker_price_scalar(100.0, 1.0, 0.01, 0.02, 1.0, 2.0)  # Compile (or load from cache) at import
+
+def linker_price(fv, T, real_yield, inflation_rate, real_coup, freq=2):
+    """Calculate inflation-linked bond price
+    Array inputs (e.g. a range of real yields) are priced by linker_price_vec
+    """
+    args = (fv, T, real_yield, inflation_rate, real_coup, freq)
+    if any(np.ndim(a) != 0 for a in args):
+        return linker_price_vec(*args)
+    # Plain floats keep the interpreted path on Python float arithmetic rather than NumPy scalars
+    return _linker_price_scalar(*(float(a) for a in args))
+
+def _plot_sensitivity(ax, changes, price_changes, step, xlabel, title, marker_range=range(-3, 4)):
+    """Draw a price sensitivity curve with labelled markers on a uniform grid of changes"""
+    # Main price sensitivity curve
+    ax.plot(changes, price_changes, 'b-', linewidth=2)
+
+    # Reference lines at current levels
+    ax.axhline(y=0, color='black', linestyle='-', linewidth=0.5)
+    ax.axvline(x=0, color='black', linestyle='-', linewidth=0.5)
+
+    # Add markers and labels for 1% changes
+    for d in marker_range:
+        if d != 0:
+            idx = int(round((d - changes[0]) / step))  # Position on the uniform grid
+            pct = price_changes[idx]
+            # Vertical reference line
+            ax.plot([d, d], [0, pct], 'k:', alpha=0.5)
+            # Price change label with offset for readability
+            x_offset = -0.4 if d < 0 else 0.4
+            # Move all labels down by 40% of their value
+            y_offset = pct * -0.4  # Negative to move down
+            ax.text(d + x_offset, pct + y_offset, f'{pct:.1f}%', 
+                    horizontalalignment='right' if d < 0 else 'left',
+                    verticalalignment='bottom' if pct > 0 else 'top')
+
+    ax.grid(True, alpha=0.2)
+    ax.set_xlabel(xlabel, fontsize=10)
+    ax.set_ylabel('Price Change (%)', fontsize=10)
+    ax.set_title(title, fontsize=12, pad=20)
 
 ###########################################
 # Analysis Parameters
@@ -59,239 +148,167 @@ linker_coup = 0.125  # 0.125% coupon
 linker_real_yield = 0.0175  # Current real yield ~+1.75%
 inflation_rate = 0.041  # Current RPI inflation ~4.1%
 
+# Step (%) of the sensitivity grids used by Sections 1-3
+rate_step = 0.5
+
 ###########################################
 # Analysis and Visualization
 ###########################################
 
-# 1. UK Gilt Price Sensitivity
-rate_changes = np.arange(-4, 4.5, 0.5)  # Match treasury range
-gilt_price_changes = []
-gilt_prices = []
-
-base_gilt_price = linker_price(uk_par, uk_T, uk_yield, 0, uk_coup)
-for dr in rate_changes:
-    new_rate = uk_yield + dr/100
-    new_price = linker_price(uk_par, uk_T, new_rate, 0, uk_coup)
-    pct_change = ((new_price / base_gilt_price) - 1) * 100
-    gilt_price_changes.append(pct_change)
-    gilt_prices.append(new_price)
-
-# Find rate change needed for price = 100
-gilt_prices = np.array(gilt_prices)
-par_rate_change = np.interp(100, gilt_prices[::-1], rate_changes[::-1])
-par_pct_change = ((100 / base_gilt_price) - 1) * 100
-
-plt.figure(figsize=(12, 8))
-plt.style.use('classic')
-
-# Main price sensitivity curve
-plt.plot(rate_changes, gilt_price_changes, 'b-', linewidth=2)
-
-# Reference lines at current levels
-plt.axhline(y=0, color='black', linestyle='-', linewidth=0.5)
-plt.axvline(x=0, color='black', linestyle='-', linewidth=0.5)
-
-# Add markers and labels for 1% yield changes
-for dr in range(-3, 4):
-    if dr != 0:
-        idx = np.where(rate_changes == dr)[0][0]
-        pct = gilt_price_changes[idx]
-        # Vertical reference line
-        plt.plot([dr, dr], [0, pct], 'k:', alpha=0.5)
-        # Price change label with offset for readability
-        x_offset = -0.4 if dr < 0 else 0.4
-        # Move all labels down by 40% of their value
-        y_offset = pct * -0.4  # Negative to move down
-        plt.text(dr + x_offset, pct + y_offset, f'{pct:.1f}%', 
-                horizontalalignment='right' if dr < 0 else 'left',
-                verticalalignment='bottom' if pct > 0 else 'top')
-
-# Add par marker
-plt.plot([par_rate_change], [par_pct_change], 'ro')  # Red dot at par point
-plt.plot([par_rate_change, par_rate_change], [0, par_pct_change], 'r:', alpha=0.5)
-plt.text(par_rate_change + 0.1, par_pct_change, f'Par: {par_rate_change:.1f}%', 
-        color='red', horizontalalignment='left')
-
-plt.grid(True, alpha=0.2)
-plt.xlabel('Change in Yield (%)', fontsize=10)
-plt.ylabel('Price Change (%)', fontsize=10)
-plt.title(f'UK Gilt 0.5% 2061 Price Sensitivity\nCurrent Price: £{base_gilt_price:.2f}, YTM: {uk_yield*100:.2f}%',
-          fontsize=12, pad=20)
-
-plt.savefig('uk_gilt_sensitivity.png',
-            dpi=300,
-            bbox_inches='tight',
-            facecolor='white')
-plt.close()
-
-# 2. Linker Price Sensitivity to Real Yields
-real_rate_changes = np.arange(-4, 4.5, 0.5)  # Match treasury range
-linker_price_changes = []
-
-base_linker_price = linker_price(linker_par, linker_T, linker_real_yield, inflation_rate, linker_coup)
-for dr in real_rate_changes:
-    new_real_rate = linker_real_yield + dr/100
-    new_price = linker_price(linker_par, linker_T, new_real_rate, inflation_rate, linker_coup)
-    pct_change = ((new_price / base_linker_price) - 1) * 100
-    linker_price_changes.append(pct_change)
-
-plt.figure(figsize=(12, 8))
-plt.style.use('classic')
-
-# Main price sensitivity curve
-plt.plot(real_rate_changes, linker_price_changes, 'b-', linewidth=2)
-
-# Reference lines at current levels
-plt.axhline(y=0, color='black', linestyle='-', linewidth=0.5)
-plt.axvline(x=0, color='black', linestyle='-', linewidth=0.5)
-
-# Add markers and labels for 1% yield changes
-for dr in range(-3, 4):
-    if dr != 0:
-        idx = np.where(real_rate_changes == dr)[0][0]
-        pct = linker_price_changes[idx]
-        # Vertical reference line
-        plt.plot([dr, dr], [0, pct], 'k:', alpha=0.5)
-        # Price change label with offset for readability
-        x_offset = -0.4 if dr < 0 else 0.4
-        # Move all labels down by 40% of their value
-        y_offset = pct * -0.4  # Negative to move down
-        plt.text(dr + x_offset, pct + y_offset, f'{pct:.1f}%', 
-                horizontalalignment='right' if dr < 0 else 'left',
-                verticalalignment='bottom' if pct > 0 else 'top')
-
-plt.grid(True, alpha=0.2)
-plt.xlabel('Change in Real Yield (%)', fontsize=10)
-plt.ylabel('Price Change (%)', fontsize=10)
-plt.title(f'UK Index-linked 0.125% 2073 Real Yield Sensitivity\nCurrent Price: £{base_linker_price:.2f}, Real Yield: {linker_real_yield*100:.2f}%',
-          fontsize=12, pad=20)
-
-plt.savefig('uk_linker_sensitivity.png',
-            dpi=300,
-            bbox_inches='tight',
-            facecolor='white')
-plt.close()
-
-# 3. Inflation Sensitivity
-inflation_changes = np.arange(-4, 4.5, 0.5)  # Match other ranges
-inflation_price_changes = []
-
-for di in inflation_changes:
-    new_inflation = inflation_rate + di/100
-    new_price = linker_price(linker_par, linker_T, linker_real_yield, new_inflation, linker_coup)
-    pct_change = ((new_price / base_linker_price) - 1) * 100
-    inflation_price_changes.append(pct_change)
-
-plt.figure(figsize=(12, 8))
-plt.style.use('classic')
-
-# Main price sensitivity curve
-plt.plot(inflation_changes, inflation_price_changes, 'b-', linewidth=2)
-
-# Reference lines at current levels
-plt.axhline(y=0, color='black', linestyle='-', linewidth=0.5)
-plt.axvline(x=0, color='black', linestyle='-', linewidth=0.5)
-
-# Add markers and labels for 1% inflation changes
-for di in range(-3, 4):
-    if di != 0:
-        idx = np.where(inflation_changes == di)[0][0]
-        pct = inflation_price_changes[idx]
-        # Vertical reference line
-        plt.plot([di, di], [0, pct], 'k:', alpha=0.5)
-        # Price change label with offset for readability
-        x_offset = -0.4 if di < 0 else 0.4
-        # Move all labels down by 40% of their value
-        y_offset = pct * -0.4  # Negative to move down
-        plt.text(di + x_offset, pct + y_offset, f'{pct:.1f}%', 
-                horizontalalignment='right' if di < 0 else 'left',
-                verticalalignment='bottom' if pct > 0 else 'top')
-
-plt.grid(True, alpha=0.2)
-plt.xlabel('Change in Inflation Rate (%)', fontsize=10)
-plt.ylabel('Price Change (%)', fontsize=10)
-plt.title(f'UK Index-linked 0.125% 2073 Inflation Sensitivity\nCurrent Inflation: {inflation_rate*100:.1f}%',
-          fontsize=12, pad=20)
-
-plt.savefig('uk_inflation_sensitivity.png',
-            dpi=300,
-            bbox_inches='tight',
-            facecolor='white')
-plt.close()
-
-# 4. Breakeven Analysis
-inflation_changes = np.arange(-4, 4.5, 0.5)  # ±4% range
-nominal_values = []
-real_values = []
-
-# Calculate total returns (including yield) for different inflation scenarios
-for di in inflation_changes:
-    inflation_scenario = inflation_rate + di/100
-    
+def _fig1():
+    """1. UK Gilt Price Sensitivity"""
+    plt.style.use('classic')
+    fig, ax = plt.subplots(figsize=(12, 8))
+
+    rate_changes = np.arange(-4, 4 + rate_step, rate_step)  # Match treasury range
+
+    base_gilt_price = linker_price(uk_par, uk_T, uk_yield, 0, uk_coup)
+    gilt_prices = linker_price_vec(uk_par, uk_T, uk_yield + rate_changes/100, 0, uk_coup)
+    gilt_price_changes = ((gilt_prices / base_gilt_price) - 1) * 100
+
+    # Find rate change needed for price = 100
+    par_rate_change = np.interp(100, gilt_prices[::-1], rate_changes[::-1])
+    par_pct_change = ((100 / base_gilt_price) - 1) * 100
+
+    _plot_sensitivity(ax, rate_changes, gilt_price_changes, rate_step, 'Change in Yield (%)',
+                      f'UK Gilt 0.5% 2061 Price Sensitivity\nCurrent Price: £{base_gilt_price:.2f}, YTM: {uk_yield*100:.2f}%')
+
+    # Add par marker
+    ax.plot([par_rate_change], [par_pct_change], 'ro')  # Red dot at par point
+    ax.plot([par_rate_change, par_rate_change], [0, par_pct_change], 'r:', alpha=0.5)
+    ax.text(par_rate_change + 0.1, par_pct_change, f'Par: {par_rate_change:.1f}%', 
+           color='red', horizontalalignment='left')
+
+    fig.savefig('uk_gilt_sensitivity.png',
+                dpi=150,
+                bbox_inches='tight',
+                facecolor='white')
+    plt.close(fig)
+
+def _fig2():
+    """2. Linker Price Sensitivity to Real Yields"""
+    plt.style.use('classic')
+    fig, ax = plt.subplots(figsize=(12, 8))
+
+    real_rate_changes = np.arange(-4, 4 + rate_step, rate_step)  # Match treasury range
+
+    base_linker_price = linker_price(linker_par, linker_T, linker_real_yield, inflation_rate, linker_coup)
+    new_prices = linker_price_vec(linker_par, linker_T, linker_real_yield + real_rate_changes/100,
+                                  inflation_rate, linker_coup)
+    linker_price_changes = ((new_prices / base_linker_price) - 1) * 100
+
+    _plot_sensitivity(ax, real_rate_changes, linker_price_changes, rate_step, 'Change in Real Yield (%)',
+                      f'UK Index-linked 0.125% 2073 Real Yield Sensitivity\nCurrent Price: £{base_linker_price:.2f}, Real Yield: {linker_real_yield*100:.2f}%')
+
+    fig.savefig('uk_linker_sensitivity.png',
+                dpi=150,
+                bbox_inches='tight',
+                facecolor='white')
+    plt.close(fig)
+
+def _fig3():
+    """3. Inflation Sensitivity"""
+    plt.style.use('classic')
+    fig, ax = plt.subplots(figsize=(12, 8))
+
+    inflation_changes = np.arange(-4, 4 + rate_step, rate_step)  # Match other ranges
+
+    base_linker_price = linker_price(linker_par, linker_T, linker_real_yield, inflation_rate, linker_coup)
+    new_prices = linker_price_vec(linker_par, linker_T, linker_real_yield,
+                                  inflation_rate + inflation_changes/100, linker_coup)
+    inflation_price_changes = ((new_prices / base_linker_price) - 1) * 100
+
+    _plot_sensitivity(ax, inflation_changes, inflation_price_changes, rate_step, 'Change in Inflation Rate (%)',
+                      f'UK Index-linked 0.125% 2073 Inflation Sensitivity\nCurrent Inflation: {inflation_rate*100:.1f}%')
+
+    fig.savefig('uk_inflation_sensitivity.png',
+                dpi=150,
+                bbox_inches='tight',
+                facecolor='white')
+    plt.close(fig)
+
+def _fig4():
+    """4. Breakeven Analysis"""
+    plt.style.use('classic')
+    fig, ax = plt.subplots(figsize=(12, 8))
+
+    inflation_changes = np.arange(-4, 4.5, 0.5)  # ±4% range
+
     # Nominal bond: Fixed £100 redemption with annual coupon reinvestment
+    # (independent of the inflation scenario, so computed once)
     nominal_return = ((1 + uk_yield) ** uk_T) - 1  # Compound annual return
-    
+
+    # Calculate total returns (including yield) for all inflation scenarios at once
+    inflation_scenarios = inflation_rate + inflation_changes/100
+
     # Linker: Inflation-adjusted redemption with real yield
-    real_redemption = 100 * (1 + inflation_scenario)**linker_T
+    real_redemption = 100 * (1 + inflation_scenarios)**linker_T
     real_return = ((1 + linker_real_yield) ** linker_T) * (real_redemption/100) - 1
-    
+
     # Convert to percentages
-    nominal_values.append(nominal_return * 100)
-    real_values.append(real_return * 100)
-
-# Add breakeven point calculation
-breakeven_idx = np.where(np.abs(np.array(nominal_values) - np.array(real_values)) == 
-                        np.min(np.abs(np.array(nominal_values) - np.array(real_values))))[0][0]
-breakeven_inflation = inflation_changes[breakeven_idx]
-
-plt.figure(figsize=(12, 8))
-plt.style.use('classic')
-
-# Plot total return comparison
-plt.plot(inflation_changes, nominal_values, 'b-', linewidth=2, 
-         label=f'Nominal (Fixed {uk_yield*100:.1f}% YTM)')
-plt.plot(inflation_changes, real_values, 'r-', linewidth=2, 
-         label=f'Linker ({linker_real_yield*100:.1f}% Real + Inflation)')
-
-# Reference lines
-plt.axhline(y=0, color='black', linestyle='-', linewidth=0.5)
-plt.axvline(x=0, color='black', linestyle='-', linewidth=0.5)
-
-# Add current inflation marker
-plt.axvline(x=0, color='orange', linestyle=':', alpha=0.5, 
-            label=f'Current RPI: {inflation_rate*100:.1f}%')
-
-# Add a text box with the breakeven explanation
-nominal_return = ((1 + uk_yield) ** uk_T) - 1
-breakeven_text = (f'Nominal Bond Total Return: {nominal_return*100:.1f}%\n'
-                 f'Breakeven Inflation: {breakeven_inflation:.1f}%\n'
-                 f'(Where returns equalize)')
-plt.text(0.02, 0.98, breakeven_text, 
-         transform=plt.gca().transAxes,
-         verticalalignment='top',
-         bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
-
-plt.grid(True, alpha=0.2)
-plt.xlabel('Change in Inflation Rate (%)', fontsize=10)
-plt.ylabel('Total Return (%)', fontsize=10)
-plt.title('Total Return Comparison\nIncluding Yield and Inflation Effects',
-          fontsize=12, pad=20)
-plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
-
-plt.tight_layout()
-plt.savefig('uk_breakeven_analysis.png',
-            dpi=300,
-            bbox_inches='tight',
-            facecolor='white')
-plt.close()
-
-# Print key metrics
-print(f"\nUK Ultra-Long Bond Analysis")
-print(f"-------------------------")
-print(f"Nominal Gilt (0.5% 2061):")
-print(f"  Price: £{base_gilt_price:.2f}")
-print(f"  YTM: {uk_yield*100:.2f}%")
-print(f"\nIndex-linked Gilt (0.125% 2073):")
-print(f"  Price: £{base_linker_price:.2f}")
-print(f"  Real Yield: {linker_real_yield*100:.2f}%")
-print(f"\nCurrent RPI: {inflation_rate*100:.1f}%") 
\ No newline at end of file
+    nominal_values = np.full(inflation_changes.size, nominal_return * 100)
+    real_values = real_return * 100
+
+    # Add breakeven point calculation (first scenario where the returns are closest)
+    breakeven_idx = np.abs(nominal_values - real_values).argmin()
+    breakeven_inflation = inflation_changes[breakeven_idx]
+
+    # Plot total return comparison
+    ax.plot(inflation_changes, nominal_values, 'b-', linewidth=2, 
+            label=f'Nominal (Fixed {uk_yield*100:.1f}% YTM)')
+    ax.plot(inflation_changes, real_values, 'r-', linewidth=2, 
+            label=f'Linker ({linker_real_yield*100:.1f}% Real + Inflation)')
+
+    # Reference lines
+    ax.axhline(y=0, color='black', linestyle='-', linewidth=0.5)
+    ax.axvline(x=0, color='black', linestyle='-', linewidth=0.5)
+
+    # Add current inflation marker
+    ax.axvline(x=0, color='orange', linestyle=':', alpha=0.5, 
+               label=f'Current RPI: {inflation_rate*100:.1f}%')
+
+    # Add a text box with the breakeven explanation
+    breakeven_text = (f'Nominal Bond Total Return: {nominal_return*100:.1f}%\n'
+                     f'Breakeven Inflation: {breakeven_inflation:.1f}%\n'
+                     f'(Where returns equalize)')
+    ax.text(0.02, 0.98, breakeven_text, 
+            transform=ax.transAxes,
+            verticalalignment='top',
+            bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+
+    ax.grid(True, alpha=0.2)
+    ax.set_xlabel('Change in Inflation Rate (%)', fontsize=10)
+    ax.set_ylabel('Total Return (%)', fontsize=10)
+    ax.set_title('Total Return Comparison\nIncluding Yield and Inflation Effects',
+                  fontsize=12, pad=20)
+    ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
+
+    fig.tight_layout()
+    fig.savefig('uk_breakeven_analysis.png',
+                dpi=150,
+                bbox_inches='tight',
+                facecolor='white')
+    plt.close(fig)
+
+def main():
+    # The four charts are independent, so each is drawn and saved in its own process
+    with ProcessPoolExecutor(max_workers=4) as ex:
+        for future in [ex.submit(f) for f in (_fig1, _fig2, _fig3, _fig4)]:
+            future.result()
+
+    base_gilt_price = linker_price(uk_par, uk_T, uk_yield, 0, uk_coup)
+    base_linker_price = linker_price(linker_par, linker_T, linker_real_yield, inflation_rate, linker_coup)
+
+    # Print key metrics
+    print(f"\nUK Ultra-Long Bond Analysis")
+    print(f"-------------------------")
+    print(f"Nominal Gilt (0.5% 2061):")
+    print(f"  Price: £{base_gilt_price:.2f}")
+    print(f"  YTM: {uk_yield*100:.2f}%")
+    print(f"\nIndex-linked Gilt (0.125% 2073):")
+    print(f"  Price: £{base_linker_price:.2f}")
+    print(f"  Real Yield: {linker_real_yield*100:.2f}%")
+    print(f"\nCurrent RPI: {inflation_rate*100:.1f}%") 
+
+if __name__ == "__main__":
+    main()